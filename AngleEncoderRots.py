@@ -9,16 +9,59 @@
 import numpy as np
 import symengine as symeng
 
+from functools import lru_cache
 from math import ceil, log
 from ionqvision.ansatze import VariationalAnsatz
 from qiskit import QuantumCircuit
-from qiskit.circuit import ParameterExpression, ParameterVector
+from qiskit.circuit import CircuitInstruction, ParameterExpression, ParameterVector
+from qiskit.circuit.library import CXGate, RXGate, RYGate, RZGate
 from qiskit.quantum_info import SparsePauliOp
 
 
+@lru_cache(maxsize=None)
+def _cnot_entanglement(num_qubits, entanglement_depth):
+    """
+    Build (and cache) the CNOT entangling block shared by the angle encoders:
+    ``CNOT(j, j + k + 1)`` for each ``k`` in ``range(entanglement_depth)``.
+
+    The returned circuit is shared between calls and must only be composed
+    into other circuits, never modified in place.
+    """
+    qc = QuantumCircuit(num_qubits)
+    pairs = [(top_qubit, top_qubit + k + 1)
+             for k in range(entanglement_depth)
+             for top_qubit in range(num_qubits - (k + 1))]
+    append, qubits, cx = qc._append, qc.qubits, CXGate()
+    for control, target in pairs:
+        append(CircuitInstruction(cx, (qubits[control], qubits[target]), ()))
+    return qc
+
+
+class _AngleEncoderBase(VariationalAnsatz):
+    """
+    Common construction for :class:`AngleEncoderX`, :class:`AngleEncoderY` and
+    :class:`AngleEncoderZ`; subclasses set ``_rotation_gate`` to the
+    single-qubit rotation gate class (``RXGate``, ``RYGate`` or ``RZGate``).
+    """
+    _rotation_gate = None
+
+    def __init__(self, num_qubits, entanglement_depth=1, param_prefix="x"):
+        if self._rotation_gate is None:
+            raise TypeError(f"{type(self).__name__} must set _rotation_gate")
+
+        super().__init__(num_qubits)
+
+        # the rotation layer is rebuilt for every instance so that each encoder
+        # owns fresh Parameters; only the parameter-free CNOT block is cached
+        x = ParameterVector(param_prefix, num_qubits)
+        append, qubits, rot = self._append, self.qubits, self._rotation_gate
+        for qbt, xi in enumerate(x):
+            append(CircuitInstruction(rot(xi * np.pi), (qubits[qbt],), ()))
+
+        self.compose(_cnot_entanglement(num_qubits, entanglement_depth), inplace=True)
 
 
-class AngleEncoderX(VariationalAnsatz):
+class AngleEncoderX(_AngleEncoderBase):
     """
     Implement a quantum circuit for higher-order sparse angle encoding, specifically for rotating around the X direction.
 
@@ -47,20 +90,10 @@ class AngleEncoderX(VariationalAnsatz):
         q_3: ┤ Rx(π*y[3]) ├──────────┤ X ├─────┤ X ├┤ X ├
              └────────────┘          └───┘     └───┘└───┘
     """
-    def __init__(self, num_qubits, entanglement_depth=1, param_prefix="x"):
-        super().__init__(num_qubits)
-
-        x = ParameterVector(param_prefix, num_qubits)
-        [self.rx(np.pi * xi, qbt) for qbt, xi in enumerate(x)] 
+    _rotation_gate = RXGate
 
-        for k in range(entanglement_depth):
-            top_qubit = 0
-            while top_qubit < num_qubits - (k + 1):
-                self.cx(top_qubit, top_qubit + k + 1)
-                top_qubit += 1
 
-
-class AngleEncoderY(VariationalAnsatz):
+class AngleEncoderY(_AngleEncoderBase):
     """
     Implement a quantum circuit for higher-order sparse angle encoding, specifically for rotating around the Y direction.
 
@@ -89,19 +122,10 @@ class AngleEncoderY(VariationalAnsatz):
         q_3: ┤ Ry(π*y[3]) ├──────────┤ X ├─────┤ X ├┤ X ├
              └────────────┘          └───┘     └───┘└───┘
     """
-    def __init__(self, num_qubits, entanglement_depth=1, param_prefix="x"):
-        super().__init__(num_qubits)
+    _rotation_gate = RYGate
 
-        x = ParameterVector(param_prefix, num_qubits)
-        [self.ry(np.pi * xi, qbt) for qbt, xi in enumerate(x)] 
-
-        for k in range(entanglement_depth):
-            top_qubit = 0
-            while top_qubit < num_qubits - (k + 1):
-                self.cx(top_qubit, top_qubit + k + 1)
-                top_qubit += 1
 
-class AngleEncoderZ(VariationalAnsatz):
+class AngleEncoderZ(_AngleEncoderBase):
     """
     Implement a quantum circuit for higher-order sparse angle encoding, specifically for rotating around the Z direction.
 
@@ -130,14 +154,4 @@ class AngleEncoderZ(VariationalAnsatz):
         q_3: ┤ Rz(π*y[3]) ├──────────┤ X ├─────┤ X ├┤ X ├
              └────────────┘          └───┘     └───┘└───┘
     """
-    def __init__(self, num_qubits, entanglement_depth=1, param_prefix="x"):
-        super().__init__(num_qubits)
-
-        x = ParameterVector(param_prefix, num_qubits)
-        [self.rz(np.pi * xi, qbt) for qbt, xi in enumerate(x)]
-
-        for k in range(entanglement_depth):
-            top_qubit = 0
-            while top_qubit < num_qubits - (k + 1):
-                self.cx(top_qubit, top_qubit + k + 1)
-                top_qubit += 1
\ No newline at end of file
+    _rotation_gate = RZGate
@@ -1,6 +1,7 @@
 from ionqvision.ansatze import VariationalAnsatz
 from qiskit import QuantumCircuit
-from qiskit.circuit import ParameterExpression, ParameterVector
+from qiskit.circuit import CircuitInstruction, ParameterExpression, ParameterVector
+from qiskit.circuit.library import CXGate, UGate
 
 class SU2Ansatz(VariationalAnsatz):
     """
@@ -12,25 +13,29 @@ class SU2Ansatz(VariationalAnsatz):
         - ``param_prefix`` -- (optional) string prefix for named circuit
           parameters
 
+    Each ``Ry(θ[a])``, ``Rz(θ[b])`` pair is emitted as one ``U(θ[a], θ[b], 0)``
+    gate, which equals ``Rz(θ[b]) Ry(θ[a])`` up to the unobservable global
+    phase ``exp(iθ[b]/2)``.
+
     EXAMPLE:
         
         >>> numQ = 3
         >>> ansatz = SU2Ansatz(num_qubits=numQ)
         >>> ansatz.draw()
-             ┌──────────┐┌──────────┐                  ┌──────────┐ ┌──────────┐     »
-        q_0: ┤ Ry(θ[0]) ├┤ Rz(θ[3]) ├──────────■───────┤ Ry(θ[6]) ├─┤ Rz(θ[9]) ├─────»
-             ├──────────┤├──────────┤        ┌─┴─┐     ├──────────┤┌┴──────────┤     »
-        q_1: ┤ Ry(θ[1]) ├┤ Rz(θ[4]) ├──■─────┤ X ├─────┤ Ry(θ[7]) ├┤ Rz(θ[10]) ├──■──»
-             ├──────────┤├──────────┤┌─┴─┐┌──┴───┴───┐┌┴──────────┤└───────────┘┌─┴─┐»
-        q_2: ┤ Ry(θ[2]) ├┤ Rz(θ[5]) ├┤ X ├┤ Ry(θ[8]) ├┤ Rz(θ[11]) ├─────────────┤ X ├»
-             └──────────┘└──────────┘└───┘└──────────┘└───────────┘             └───┘»
-        «                  ┌───────────┐┌───────────┐
-        «q_0: ──────■──────┤ Ry(θ[12]) ├┤ Rz(θ[15]) ├
-        «         ┌─┴─┐    ├───────────┤├───────────┤
-        «q_1: ────┤ X ├────┤ Ry(θ[13]) ├┤ Rz(θ[16]) ├
-        «     ┌───┴───┴───┐├───────────┤└───────────┘
-        «q_2: ┤ Ry(θ[14]) ├┤ Rz(θ[17]) ├─────────────
-        «     └───────────┘└───────────┘             
+             ┌────────────────┐                         ┌────────────────┐     »
+        q_0: ┤ U(θ[0],θ[3],0) ├──────────────■──────────┤ U(θ[6],θ[9],0) ├─────»
+             ├────────────────┤            ┌─┴─┐       ┌┴────────────────┤     »
+        q_1: ┤ U(θ[1],θ[4],0) ├──■─────────┤ X ├───────┤ U(θ[7],θ[10],0) ├──■──»
+             ├────────────────┤┌─┴─┐┌──────┴───┴──────┐└─────────────────┘┌─┴─┐»
+        q_2: ┤ U(θ[2],θ[5],0) ├┤ X ├┤ U(θ[8],θ[11],0) ├───────────────────┤ X ├»
+             └────────────────┘└───┘└─────────────────┘                   └───┘»
+        «                         ┌──────────────────┐
+        «q_0: ─────────■──────────┤ U(θ[12],θ[15],0) ├
+        «            ┌─┴─┐        ├──────────────────┤
+        «q_1: ───────┤ X ├────────┤ U(θ[13],θ[16],0) ├
+        «     ┌──────┴───┴───────┐└──────────────────┘
+        «q_2: ┤ U(θ[14],θ[17],0) ├────────────────────
+        «     └──────────────────┘
             """
     
     def __init__(self, num_qubits, param_prefix="θ"):
@@ -38,15 +43,29 @@ class SU2Ansatz(VariationalAnsatz):
 
         qubits = list(range(num_qubits))
 
-        theta = iter(ParameterVector(param_prefix, 2*num_qubits**2))
-        
-        [self.ry(next(theta), qubit) for qubit in qubits]
-        [self.rz(next(theta), qubit) for qubit in qubits]
+        theta = list(ParameterVector(param_prefix, 2*num_qubits**2))
+        k = 0
+
+        append, circuit_qubits = self._append, self.qubits
+
+        # each Ry(a), Rz(b) pair is emitted as U(a, b, 0) == exp(ib/2) Rz(b) Ry(a);
+        # the phase is global and unobservable, so it is not tracked
+        for qubit in qubits:
+            gate = UGate(theta[k + qubit], theta[k + num_qubits + qubit], 0)
+            append(CircuitInstruction(gate, (circuit_qubits[qubit],), ()))
+        k += 2*num_qubits
+
+        pairs = [(qubits[i-1], qubits[i]) for i in range(num_qubits-1, 0, -1)]
+        ladder = QuantumCircuit(num_qubits)
+        cx = CXGate()
+        for control, target in pairs:
+            ladder._append(CircuitInstruction(cx, (ladder.qubits[control], ladder.qubits[target]), ()))
 
         for j in range(0, num_qubits-1):
         
-            for i in range(num_qubits-1, 0, -1):
-                self.cx(qubits[i-1], qubits[i])
+            self.compose(ladder, inplace=True)
                 
-            [self.ry(next(theta), qubit) for qubit in qubits]
-            [self.rz(next(theta), qubit) for qubit in qubits]
\ No newline at end of file
+            for qubit in qubits:
+                gate = UGate(theta[k + qubit], theta[k + num_qubits + qubit], 0)
+                append(CircuitInstruction(gate, (circuit_qubits[qubit],), ()))
+            k += 2*num_qubits
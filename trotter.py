@@ -1,12 +1,9 @@
 import numpy as np
-import symengine as symeng
-from scipy.linalg import expm
 
-from math import ceil, log
 from ionqvision.ansatze import VariationalAnsatz
-from qiskit import QuantumCircuit
-from qiskit.circuit import ParameterExpression, ParameterVector
-from qiskit.quantum_info import SparsePauliOp, Operator
+from qiskit.circuit import CircuitInstruction, ParameterVector
+from qiskit.circuit.library import RXGate, RYGate, RZGate, UGate
+from qiskit.synthesis import OneQubitEulerDecomposer
 
 
 class ButterflyOrthogonalAnsatz(VariationalAnsatz):
@@ -22,35 +19,33 @@ class ButterflyOrthogonalAnsatz(VariationalAnsatz):
             >>> ansatz = ButterflyOrthogonalAnsatz(4)
 
         """
-        d = int(log(num_qubits, 2))
-        if abs(log(num_qubits, 2) - d) > 1e-8:
-            raise ValueError("num_qubits nums be a power of 2")
-
-        # defines matrices needed for Suzuki-Trotter Circuit
-        I = np.array([[1, 0], [0, 1]], dtype=complex)  # Identity matrix
-        X = np.array([[0, 1], [1, 0]], dtype=complex)  # Pauli-X matrix
-        Y = np.array([[0, -1j], [1j, 0]], dtype=complex)  # Pauli-Y matrix
-        Z = np.array([[1, 0], [0, -1]], dtype=complex)  # Pauli-Z matrix
-        H1 = np.kron(np.kron(np.kron(X, I), I), I)
-        H2 = np.kron(np.kron(np.kron(Y, I), I), I)
-        H3 = np.kron(np.kron(np.kron(Z, I), I), I)
+        if num_qubits <= 0 or num_qubits & (num_qubits - 1):
+            raise ValueError("num_qubits must be a power of 2")
+        d = (num_qubits - 1).bit_length()
+
+        # Suzuki-Trotter step: exp(-i P⊗I⊗...⊗I) = exp(-iP)⊗I⊗...⊗I for
+        # P = X, Y, Z, so only the 2x2 factor acting on the most significant
+        # qubit is needed, i.e. Rx(2), Ry(2), Rz(2) on q_{-1}, fused into a
+        # single U gate; the phase dropped by U is restored on the circuit
+        trotter_op = RZGate(2.0).to_matrix() @ RYGate(2.0).to_matrix() @ RXGate(2.0).to_matrix()
+        *trotter_angles, trotter_phase = OneQubitEulerDecomposer("U3").angles_and_phase(trotter_op)
+        trotter_gate = UGate(*trotter_angles)
 
         super().__init__(num_qubits)
-        theta = iter(ParameterVector(param_prefix, d * num_qubits//2))
+        theta = list(ParameterVector(param_prefix, d * num_qubits//2))
+        self.global_phase += trotter_phase * len(theta)
+        k = 0
+        trotter_step = CircuitInstruction(trotter_gate, (self.qubits[-1],), ())
+        pow2 = [1 << p for p in range(d + 1)]
         for depth in reversed(range(d)):
-            for j in range(2**depth):
-                for i in range(2**(d - depth - 1)):
-                    offset = i*2**(depth + 1)
-                    qubits = [offset + j, offset + j + 2**depth]
-                    self.rbs(next(theta), *qubits)
-                    # Suzuki-Trotter Circuit
-                    self.append(self._evolve(H1, 1).to_instruction(), range(num_qubits))
-                    self.append(self._evolve(H2, 1).to_instruction(), range(num_qubits))
-                    self.append(self._evolve(H3, 1).to_instruction(), range(num_qubits))
+            # RBS(offset + j, offset + j + 2**depth) for each j, then each offset
+            offsets = np.arange(pow2[d - depth - 1]) * pow2[depth + 1]
+            first = (np.arange(pow2[depth])[:, None] + offsets[None, :]).ravel()
+            pairs = np.stack([first, first + pow2[depth]], axis=1).tolist()
+            for qubits in pairs:
+                self.rbs(theta[k], *qubits)
+                k += 1
+                # Suzuki-Trotter Circuit
+                self._append(trotter_step)
             self.barrier()
 
-
-    def _evolve(self, H, dt):
-        """Evolve the state by Hamiltonian H over time dt."""
-        U = Operator(expm(-1j * H * dt))  # Unitary operator
-        return U